@@ -28,8 +28,9 @@ class DatePickerListener(dynamic_proxy(DatePickerDialog.OnDateSetListener)):
         with suppress_reference_error():
             # It should be impossible for the dialog to return an out-of-range value in
             # normal use, but it can happen in the testbed, so go via the interface to
-            # clip the value.
-            self.impl.interface.value = date(year, month_0 + 1, day)
+            # clip the value. The value is already a date, so it doesn't need to go
+            # through the conversion performed by the `value` setter.
+            self.impl.interface._set_value(date(year, month_0 + 1, day))
 
 
 class DateInput(PickerBase, ContainedWidget):
@@ -196,6 +196,12 @@ def wrapped_handler(
     return _handler
 
 
+# Wrapping None without a cleanup method doesn't depend on the interface, so a single
+# no-op handler can be shared by anything whose handler has been cleared, rather than
+# allocating a new wrapper each time.
+NOOP_HANDLER = wrapped_handler(None, None)
+
+
 class OnResultT(Protocol):
     def __call__(self, result: Any, exception: Exception | None = None) -> object: ...
 
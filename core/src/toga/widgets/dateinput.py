@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import datetime
+from functools import lru_cache
 from typing import Any, Protocol
 
 import toga
-from toga.handlers import wrapped_handler
+from toga.handlers import NOOP_HANDLER, wrapped_handler
 
 from .base import StyleT, Widget
 
@@ -15,6 +16,17 @@ from .base import StyleT, Widget
 MIN_DATE = datetime.date(1800, 1, 1)
 MAX_DATE = datetime.date(8999, 12, 31)
 
+# Range checks compare ordinals, which is cheaper than comparing dates.
+_MIN_ORDINAL = MIN_DATE.toordinal()
+_MAX_ORDINAL = MAX_DATE.toordinal()
+
+
+# DateInputs are often populated from data where the same date strings recur, so keep
+# recently parsed values. Dates are immutable, so the results can be safely shared.
+@lru_cache(maxsize=512)
+def _parse_iso_date(value: str) -> datetime.date:
+    return datetime.date.fromisoformat(value)
+
 
 class OnChangeHandler(Protocol):
     def __call__(self, widget: DateInput, **kwargs: Any) -> None:
@@ -52,7 +64,9 @@ class DateInput(Widget):
         """
         super().__init__(id, style, **kwargs)
 
-        self.on_change = None
+        # Set a dummy handler before installing the actual on_change, because we do not
+        # want on_change triggered by the initial value being set
+        self._on_change = NOOP_HANDLER
         self.min = min
         self.max = max
 
@@ -74,32 +88,41 @@ class DateInput(Widget):
 
     @value.setter
     def value(self, value: datetime.date | str | None) -> None:
-        value = self._convert_date(value, check_range=False)
-
-        if value < self.min:
-            value = self.min
-        elif value > self.max:
-            value = self.max
+        self._set_value(self._convert_date(value, check_range=False))
+
+    def _set_value(self, value: datetime.date) -> None:
+        # Clip a date to the current range and apply it. Backends that are reporting a
+        # date from the native widget can call this directly, as it doesn't need
+        # converting. Each property read is a call into the backend, so only do it once.
+        min_date = self._impl.get_min_date()
+        max_date = self._impl.get_max_date()
+        if value < min_date:
+            value = min_date
+        elif value > max_date:
+            value = max_date
 
         self._impl.set_value(value)
 
     def _convert_date(self, value: object, *, check_range: bool) -> datetime.date:
-        match value:
-            case None:
-                value = datetime.date.today()
-            case datetime.datetime():
-                value = value.date()
-            case datetime.date():
-                pass
-            case str():
-                value = datetime.date.fromisoformat(value)
-            case _:
-                raise TypeError("Not a valid date value")
+        # Plain dates are by far the most common input, and need no conversion.
+        if type(value) is not datetime.date:
+            match value:
+                case None:
+                    value = datetime.date.today()
+                case datetime.datetime():
+                    value = value.date()
+                case datetime.date():
+                    pass
+                case str():
+                    value = _parse_iso_date(value)
+                case _:
+                    raise TypeError("Not a valid date value")
 
         if check_range:
-            if value < MIN_DATE:
+            ordinal = value.toordinal()
+            if ordinal < _MIN_ORDINAL:
                 raise ValueError(f"The lowest supported date is {MIN_DATE.isoformat()}")
-            if value > MAX_DATE:
+            if ordinal > _MAX_ORDINAL:
                 raise ValueError(
                     f"The highest supported date is {MAX_DATE.isoformat()}"
                 )
@@ -126,11 +149,13 @@ class DateInput(Widget):
         else:
             min = self._convert_date(value, check_range=True)
 
-        if self.max < min:
+        # The new minimum is guaranteed to be within the range, so the value can be
+        # clipped without going back through the value setter.
+        if self._impl.get_max_date() < min:
             self._impl.set_max_date(min)
         self._impl.set_min_date(min)
-        if self.value < min:
-            self.value = min
+        if self._impl.get_value() < min:
+            self._impl.set_value(min)
 
     @property
     def max(self) -> datetime.date:
@@ -152,17 +177,23 @@ class DateInput(Widget):
         else:
             max = self._convert_date(value, check_range=True)
 
-        if self.min > max:
+        # The new maximum is guaranteed to be within the range, so the value can be
+        # clipped without going back through the value setter.
+        if self._impl.get_min_date() > max:
             self._impl.set_min_date(max)
         self._impl.set_max_date(max)
-        if self.value > max:
-            self.value = max
+        if self._impl.get_value() > max:
+            self._impl.set_value(max)
 
     @property
     def on_change(self) -> OnChangeHandler:
         """The handler to invoke when the date value changes."""
+        if self._on_change is None:
+            self._on_change = wrapped_handler(self, self._raw_on_change)
         return self._on_change
 
     @on_change.setter
     def on_change(self, handler: toga.widgets.dateinput.OnChangeHandler) -> None:
-        self._on_change = wrapped_handler(self, handler)
+        # The handler is wrapped the first time it's needed, as it may never be used.
+        self._raw_on_change = handler
+        self._on_change = NOOP_HANDLER if handler is None else None
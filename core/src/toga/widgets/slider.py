@@ -5,7 +5,7 @@ from contextlib import contextmanager
 from typing import Any, Protocol, SupportsFloat
 
 import toga
-from toga.handlers import wrapped_handler
+from toga.handlers import NOOP_HANDLER, wrapped_handler
 
 from .base import StyleT, Widget
 
@@ -73,15 +73,47 @@ class Slider(Widget):
         """
         super().__init__(id, style, **kwargs)
 
+        # While this is non-zero, on_change events from the backend are ignored.
+        self._suppress_on_change = 0
+
         # Set a dummy handler before installing the actual on_change, because we do not
         # want on_change triggered by the initial value being set
-        self.on_change = None
-        self.min = min
-        self.max = max
-        self.tick_count = tick_count
+        self._on_change = NOOP_HANDLER
         if value is None:
             value = (min + max) / 2
-        self.value = value
+
+        # The range and tick count are only ever changed by the interface, so they are
+        # cached to avoid calling into the backend every time a value is rounded.
+        configure = getattr(self._impl, "configure", None)
+        if configure is None:
+            # The backend has no way to apply the initial state in one call, so use
+            # the individual properties.
+            self._cached_min = self._impl.get_min()
+            self._cached_max = self._impl.get_max()
+            self._cached_tick_count = self._impl.get_tick_count()
+            self._update_tick_step()
+
+            self.min = min
+            self.max = max
+            self.tick_count = tick_count
+            self.value = value
+        else:
+            # Resolve the initial state with the same clipping and rounding as the
+            # property setters, so it can be passed to the backend in a single call.
+            self._check_tick_count(tick_count)
+            _min, _max = self._clip_range(float(min), float(max), keep_max=True)
+            value = self._clip_value(float(value), _min, _max)
+            self._cached_min = _min
+            self._cached_max = _max
+            self._cached_tick_count = tick_count
+            self._update_tick_step()
+
+            configure(
+                min=_min,
+                max=_max,
+                tick_count=tick_count,
+                value=self._round_value(value),
+            )
 
         self.on_change = on_change
         self.on_press = on_press
@@ -93,17 +125,46 @@ class Slider(Widget):
         return self.factory.Slider(interface=self)
 
     # Backends are inconsistent about when they produce events for programmatic changes,
-    # so we deal with those in the interface layer.
+    # so we deal with those in the interface layer. All programmatic changes go through
+    # here: backend events are suppressed for the duration, and on_change is called
+    # once afterwards if the value reported by the backend has changed.
     @contextmanager
     def _programmatic_change(self) -> float:
-        old_value = self.value
-        on_change = self._on_change
-        self.on_change = None
-        yield old_value
+        old_value = self._impl.get_value()
+        self._suppress_on_change += 1
+        try:
+            yield old_value
+        finally:
+            self._suppress_on_change -= 1
+
+        if self._impl.get_value() != old_value:
+            self.on_change()
+
+    # The rules for a consistent state are shared by the constructor and the property
+    # setters.
+    @staticmethod
+    def _check_tick_count(tick_count: int | None) -> None:
+        if (tick_count is not None) and (tick_count < 2):
+            raise ValueError("tick count must be at least 2")
 
-        self._on_change = on_change
-        if self.value != old_value:
-            on_change()
+    @staticmethod
+    def _clip_range(_min: float, _max: float, *, keep_max: bool) -> tuple[float, float]:
+        # If the range is inverted, the limit that isn't being kept is moved to meet
+        # the one that is.
+        if _min > _max:
+            if keep_max:
+                _min = _max
+            else:
+                _max = _min
+        return _min, _max
+
+    @staticmethod
+    def _clip_value(value: float, _min: float, _max: float) -> float:
+        if value < _min:
+            return _min
+        elif value > _max:
+            return _max
+        return value
 
     @property
     def value(self) -> float:
@@ -117,23 +178,34 @@ class Slider(Widget):
 
     @value.setter
     def value(self, value: float) -> None:
-        if value < self.min:
-            value = self.min
-        elif value > self.max:
-            value = self.max
-        with self._programmatic_change():
-            self._set_value(value)
+        value = self._clip_value(value, self._cached_min, self._cached_max)
+        with self._programmatic_change() as old_value:
+            # Re-assigning the current value is common, and doesn't need to write to
+            # the backend. The value can be changed by the user at any time, so it
+            # can't be cached on the interface.
+            new_value = self._round_value(float(value))
+            if new_value != old_value:
+                self._impl.set_value(new_value)
 
     def _set_value(self, value: SupportsFloat) -> None:
         self._impl.set_value(self._round_value(float(value)))
 
     def _round_value(self, value: float) -> float:
-        step = self.tick_step
+        step = self._cached_tick_step
         if step is not None:
             # Round to the nearest tick.
-            value = self.min + round((value - self.min) / step) * step
+            _min = self._cached_min
+            value = _min + round((value - _min) / step) * step
         return value
 
+    def _update_tick_step(self) -> None:
+        tick_count = self._cached_tick_count
+        span = self._cached_max - self._cached_min
+        if tick_count is None or span == 0:
+            self._cached_tick_step = None
+        else:
+            self._cached_tick_step = span / (tick_count - 1)
+
     @property
     def min(self) -> float:
         """Minimum allowed value.
@@ -147,17 +219,20 @@ class Slider(Widget):
     @min.setter
     def min(self, value: SupportsFloat) -> None:
         with self._programmatic_change() as old_value:
-            # Some backends will clip the current value within the range automatically,
-            # but do it ourselves to be certain. In discrete mode, setting self.value
-            # also rounds to the new positions of the ticks.
-            _min = float(value)
-            _max = self.max
-            if _max < _min:
-                _max = _min
+            # Some backends will clip the current value within the range
+            # automatically, but do it ourselves to be certain. In discrete mode, the
+            # value is also rounded to the new positions of the ticks.
+            _min, _max = self._clip_range(
+                float(value), self._cached_max, keep_max=False
+            )
+            if _max != self._cached_max:
                 self._impl.set_max(_max)
+                self._cached_max = _max
 
             self._impl.set_min(_min)
-            self._set_value(max(_min, min(_max, old_value)))
+            self._cached_min = _min
+            self._update_tick_step()
+            self._set_value(self._clip_value(old_value, _min, _max))
 
     @property
     def max(self) -> float:
@@ -172,17 +247,18 @@ class Slider(Widget):
     @max.setter
     def max(self, value: SupportsFloat) -> None:
         with self._programmatic_change() as old_value:
-            # Some backends will clip the current value within the range automatically,
-            # but do it ourselves to be certain. In discrete mode, setting self.value
-            # also rounds to the new positions of the ticks.
-            _min = self.min
-            _max = float(value)
-            if _min > _max:
-                _min = _max
+            # Some backends will clip the current value within the range
+            # automatically, but do it ourselves to be certain. In discrete mode, the
+            # value is also rounded to the new positions of the ticks.
+            _min, _max = self._clip_range(self._cached_min, float(value), keep_max=True)
+            if _min != self._cached_min:
                 self._impl.set_min(_min)
+                self._cached_min = _min
 
             self._impl.set_max(_max)
-            self._set_value(max(_min, min(_max, old_value)))
+            self._cached_max = _max
+            self._update_tick_step()
+            self._set_value(self._clip_value(old_value, _min, _max))
 
     @property
     def tick_count(self) -> int | None:
@@ -209,15 +285,16 @@ class Slider(Widget):
 
     @tick_count.setter
     def tick_count(self, tick_count: float | None) -> None:
-        if (tick_count is not None) and (tick_count < 2):
-            raise ValueError("tick count must be at least 2")
+        self._check_tick_count(tick_count)
         with self._programmatic_change() as old_value:
             # Some backends will round the current value to the nearest tick
             # automatically, but do it ourselves to be certain. Some backends also
             # require the value to be refreshed when moving between discrete and
             # continuous mode, because this causes a change in the native range.
             self._impl.set_tick_count(tick_count)
-            self.value = old_value
+            self._cached_tick_count = tick_count
+            self._update_tick_step()
+            self._set_value(old_value)
 
     @property
     def tick_step(self) -> float | None:
@@ -230,9 +307,7 @@ class Slider(Widget):
         This property is read-only, and depends on the values of
         [`tick_count`][toga.Slider.tick_count] and [`range`][].
         """
-        if self.tick_count is None or self.max == self.min:
-            return None
-        return (self.max - self.min) / (self.tick_count - 1)
+        return self._cached_tick_step
 
     @property
     def tick_value(self) -> float | None:
@@ -245,22 +320,24 @@ class Slider(Widget):
 
         :raises ValueError: If set to anything inconsistent with the rules above.
         """
-        if self.tick_count is not None and self.tick_step is not None:
-            return round((self.value - self.min) / self.tick_step) + 1
+        step = self._cached_tick_step
+        if step is not None:
+            return round((self._impl.get_value() - self._cached_min) / step) + 1
         else:
             return None
 
     @tick_value.setter
     def tick_value(self, tick_value: int | None) -> None:
-        if self.tick_count is None:
+        if self._cached_tick_count is None:
             if tick_value is not None:
                 raise ValueError("cannot set tick value when tick count is None")
         else:
-            if tick_value is None or self.tick_step is None:
+            step = self._cached_tick_step
+            if tick_value is None or step is None:
                 raise ValueError(
                     "cannot set tick value to None when tick count is not None"
                 )
-            self.value = self.min + (tick_value - 1) * self.tick_step
+            self.value = self._cached_min + (tick_value - 1) * step
 
     @property
     def on_change(self) -> OnChangeHandler:
@@ -269,29 +346,43 @@ class Slider(Widget):
 
         Setting the widget to its existing value will not call the handler.
         """
+        # Backends invoke the handler through this property, so this is where events
+        # caused by programmatic changes are discarded.
+        if self._suppress_on_change:
+            return NOOP_HANDLER
+        if self._on_change is None:
+            self._on_change = wrapped_handler(self, self._raw_on_change)
         return self._on_change
 
     @on_change.setter
     def on_change(self, handler: toga.widgets.slider.OnChangeHandler) -> None:
-        self._on_change = wrapped_handler(self, handler)
+        # Handlers are wrapped the first time they're needed, as many are never used.
+        self._raw_on_change = handler
+        self._on_change = NOOP_HANDLER if handler is None else None
 
     @property
     def on_press(self) -> OnPressHandler:
         """Handler to invoke when the user presses the slider before changing it."""
+        if self._on_press is None:
+            self._on_press = wrapped_handler(self, self._raw_on_press)
         return self._on_press
 
     @on_press.setter
     def on_press(self, handler: toga.widgets.slider.OnPressHandler) -> None:
-        self._on_press = wrapped_handler(self, handler)
+        self._raw_on_press = handler
+        self._on_press = NOOP_HANDLER if handler is None else None
 
     @property
     def on_release(self) -> OnReleaseHandler:
         """Handler to invoke when the user releases the slider after changing it."""
+        if self._on_release is None:
+            self._on_release = wrapped_handler(self, self._raw_on_release)
         return self._on_release
 
     @on_release.setter
     def on_release(self, handler: OnReleaseHandler) -> None:
-        self._on_release = wrapped_handler(self, handler)
+        self._raw_on_release = handler
+        self._on_release = NOOP_HANDLER if handler is None else None
 
 
 class SliderImpl(ABC):
@@ -321,6 +412,24 @@ class SliderImpl(ABC):
     @abstractmethod
     def set_tick_count(self, tick_count: int | None) -> None: ...
 
+    def configure(
+        self, *, min: float, max: float, tick_count: int | None, value: float
+    ) -> None:
+        """Set the initial state of the slider.
+
+        Backends that can apply several properties in a single native call can
+        override this; by default, the individual setters are used.
+        """
+        # Make sure min never exceeds max while the range is being changed.
+        if min > self.get_max():
+            self.set_max(max)
+            self.set_min(min)
+        else:
+            self.set_min(min)
+            self.set_max(max)
+        self.set_tick_count(tick_count)
+        self.set_value(value)
+
 
 class IntSliderImpl(SliderImpl):
     """Base class for implementations which use integer values."""
@@ -337,14 +446,24 @@ class IntSliderImpl(SliderImpl):
         self.max: int | float = 1
         self.discrete = False
 
+        # Factors for converting between values and ints. These are updated whenever
+        # the range or the int max changes, so that conversions don't need to query
+        # the native widget.
+        self._int_max = 1
+        self._value_to_int_scale = 1.0
+        self._int_to_value_scale = 1.0
+
+    def _update_scale(self) -> None:
+        span = self.max - self.min
+        # In an empty range, every value maps to an int value of 0.
+        self._value_to_int_scale = 0.0 if span == 0 else self._int_max / span
+        self._int_to_value_scale = span / self._int_max
+
     def get_value(self) -> float:
         return self.value
 
     def set_value(self, value: float) -> None:
-        span = self.max - self.min
-        self.set_int_value(
-            0 if span == 0 else round((value - self.min) / span * self.get_int_max())
-        )
+        self.set_int_value(round((value - self.min) * self._value_to_int_scale))
         self.value = value  # Cache the original value so we can round-trip it.
 
     def get_min(self) -> float:
@@ -352,12 +471,14 @@ class IntSliderImpl(SliderImpl):
 
     def set_min(self, value: float) -> None:
         self.min = value
+        self._update_scale()
 
     def get_max(self) -> float:
         return self.max
 
     def set_max(self, value: float) -> None:
         self.max = value
+        self._update_scale()
 
     def get_tick_count(self) -> int | None:
         return (self.get_int_max() + 1) if self.discrete else None
@@ -365,17 +486,20 @@ class IntSliderImpl(SliderImpl):
     def set_tick_count(self, tick_count: int | None) -> None:
         if tick_count is None:
             self.discrete = False
-            self.set_int_max(self.CONTINUOUS_MAX)
+            self._int_max = self.CONTINUOUS_MAX
         else:
             self.discrete = True
-            self.set_int_max(tick_count - 1)
+            self._int_max = tick_count - 1
+        # Changing the native max may clamp the native value, producing a change event,
+        # so the scale must be up to date before the native max is changed.
+        self._update_scale()
+        self.set_int_max(self._int_max)
         self.set_ticks_visible(self.discrete)
 
     # Instead of calling the event handler directly, implementations should call this
     # method.
     def on_change(self) -> None:
-        span = self.max - self.min
-        self.value = self.min + (self.get_int_value() / self.get_int_max() * span)
+        self.value = self.min + self.get_int_value() * self._int_to_value_scale
         self.interface.on_change()
 
     @abstractmethod
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 
 from toga.handlers import (
+    NOOP_HANDLER,
     AsyncResult,
     NativeHandler,
     WeakrefCallable,
@@ -29,6 +30,12 @@ def test_noop_handler():
     assert wrapped("arg1", "arg2", kwarg1=3, kwarg2=4) is None
 
 
+def test_shared_noop_handler():
+    """The shared no-op handler wraps None, and can be invoked."""
+    assert NOOP_HANDLER._raw is None
+    assert NOOP_HANDLER("arg1", "arg2", kwarg1=3, kwarg2=4) is None
+
+
 def test_noop_handler_with_cleanup():
     """Cleanup is still performed when a no-op handler is used."""
     obj = Mock()
@@ -7,6 +7,10 @@ import toga
 from toga_dummy.utils import assert_action_performed
 
 
+class DateSubclass(date):
+    """A subclass of date, which should be accepted like a plain date."""
+
+
 @pytest.fixture
 def on_change_handler():
     return Mock()
@@ -63,6 +67,7 @@ def test_widget_created_with_values(on_change_handler):
     "value, expected",
     [
         (date(2023, 1, 11), date(2023, 1, 11)),
+        (DateSubclass(2023, 1, 12), date(2023, 1, 12)),
         (datetime(2023, 2, 11, 10, 42, 37), date(2023, 2, 11)),
         ("2023-03-11", date(2023, 3, 11)),
         (None, date(2023, 5, 25)),
@@ -247,3 +252,19 @@ def test_max_clip(widget, on_change_handler, max, clip_value, clip_min):
         assert widget.min == max
     else:
         assert widget.min == date(2005, 6, 25)
+
+
+def test_on_change_wrapped_once(widget, on_change_handler):
+    """The on_change handler is only wrapped once."""
+    assert widget.on_change._raw == on_change_handler
+    assert widget.on_change is widget.on_change
+
+
+def test_clear_on_change(widget, on_change_handler):
+    """Clearing the on_change handler installs a no-op handler."""
+    widget.on_change = None
+    assert widget.on_change._raw is None
+    assert widget.on_change() is None
+
+    widget.value = date(2023, 1, 11)
+    on_change_handler.assert_not_called()
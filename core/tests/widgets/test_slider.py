@@ -1,10 +1,15 @@
+import struct
 from unittest.mock import Mock
 
 import pytest
 from pytest import approx, fixture, raises
 
 import toga
-from toga_dummy.utils import assert_action_performed, attribute_value
+from toga_dummy.utils import (
+    assert_action_performed,
+    attribute_value,
+    attribute_values,
+)
 
 INITIAL_VALUE = 50
 INITIAL_MIN = 0
@@ -71,6 +76,51 @@ def test_widget_create_initial_values(on_change):
     assert slider.style.width == 256
 
 
+@pytest.mark.parametrize(
+    "min, max, value, expected_min, expected_max, expected_value",
+    [
+        (10, 20, None, 10, 20, 15),  # Range above the initial backend range
+        (-20, -10, None, -20, -10, -15),  # Range below the initial backend range
+        (30, 20, None, 20, 20, 20),  # Minimum is clipped to the maximum
+        (10, 20, 5, 10, 20, 10),  # Value is clipped to the minimum
+        (10, 20, 25, 10, 20, 20),  # Value is clipped to the maximum
+    ],
+)
+@pytest.mark.parametrize("configure", [True, False])
+def test_widget_create_clipping(
+    monkeypatch,
+    on_change,
+    configure,
+    min,
+    max,
+    value,
+    expected_min,
+    expected_max,
+    expected_value,
+):
+    """The initial range and value are clipped consistently, whether or not the
+    backend can configure the initial state in a single call."""
+    if not configure:
+        monkeypatch.delattr(toga.widgets.slider.SliderImpl, "configure")
+
+    slider = toga.Slider(min=min, max=max, value=value, on_change=on_change)
+
+    assert slider.min == expected_min
+    assert slider.max == expected_max
+    assert slider.value == expected_value
+    on_change.assert_not_called()
+
+
+@pytest.mark.parametrize("configure", [True, False])
+def test_widget_create_tick_count_too_small(monkeypatch, configure):
+    """A slider can't be created with an invalid tick count."""
+    if not configure:
+        monkeypatch.delattr(toga.widgets.slider.SliderImpl, "configure")
+
+    with raises(ValueError, match="tick count must be at least 2"):
+        toga.Slider(tick_count=1)
+
+
 @pytest.mark.parametrize(
     "value",
     [
@@ -96,6 +146,20 @@ def test_set_value(slider, on_change, value):
     assert_value(slider, on_change, value, change_count=0)
 
 
+def test_set_same_value(slider, on_change):
+    """Re-assigning the current value doesn't update the backend."""
+    set_count = len(attribute_values(slider, "value"))
+
+    slider.value = INITIAL_VALUE
+    assert len(attribute_values(slider, "value")) == set_count
+    assert_value(slider, on_change, INITIAL_VALUE, tick_value=INITIAL_TICK_VALUE)
+
+    # A value that rounds to the current value also doesn't update the backend.
+    slider.value = INITIAL_VALUE + 1
+    assert len(attribute_values(slider, "value")) == set_count
+    assert_value(slider, on_change, INITIAL_VALUE, tick_value=INITIAL_TICK_VALUE)
+
+
 def test_set_value_to_be_min(slider, on_change):
     slider.value = INITIAL_MIN
     assert_value(slider, on_change, value=INITIAL_MIN, tick_value=1, change_count=1)
@@ -382,6 +446,16 @@ def test_set_value_with_tick_count(
     )
 
 
+def test_tick_step_empty_range(slider, on_change):
+    """A discrete slider with an empty range has no tick step."""
+    slider.min = 10
+    slider.max = 10
+    assert slider.tick_count == INITIAL_TICK_COUNT
+    assert slider.tick_step is None
+    assert slider.tick_value is None
+    assert slider.value == 10
+
+
 def test_set_tick_count_too_small(slider, on_change):
     for tick_count in [1, 0, -1]:
         with raises(ValueError, match="tick count must be at least 2"):
@@ -403,6 +477,8 @@ def test_set_on_press():
     on_press = Mock()
     slider = toga.Slider(on_press=on_press)
     assert slider.on_press._raw == on_press
+    # The handler is only wrapped once.
+    assert slider.on_press is slider.on_press
 
 
 def test_set_on_release():
@@ -411,6 +487,90 @@ def test_set_on_release():
     assert slider.on_release._raw == on_release
 
 
+def test_backend_on_change_suppressed(slider, on_change, monkeypatch):
+    """Events generated by the backend during programmatic changes are ignored."""
+    set_value = slider._impl.set_value
+
+    def set_value_with_event(value):
+        set_value(value)
+        slider._impl.interface.on_change()
+
+    monkeypatch.setattr(slider._impl, "set_value", set_value_with_event)
+
+    slider.value = 30
+    assert on_change.call_count == 1
+
+    on_change.reset_mock()
+    slider.min = 40
+    assert on_change.call_count == 1
+
+    on_change.reset_mock()
+    slider.max = 30
+    assert on_change.call_count == 1
+
+    on_change.reset_mock()
+    slider.tick_count = 2
+    assert on_change.call_count == 0
+
+    # Outside of a programmatic change, backend events are delivered.
+    slider._impl.interface.on_change()
+    assert on_change.call_count == 1
+
+
+@fixture
+def float32_slider(on_change, monkeypatch):
+    """A slider whose backend stores values with float32 precision."""
+    slider = toga.Slider(min=0, max=1, tick_count=11, value=0.3, on_change=on_change)
+    get_value = slider._impl.get_value
+    monkeypatch.setattr(
+        slider._impl,
+        "get_value",
+        lambda: struct.unpack("f", struct.pack("f", get_value()))[0],
+    )
+    return slider
+
+
+def test_range_unchanged_with_lossy_backend(float32_slider, on_change):
+    """A range change that doesn't move the backend value doesn't call on_change, even
+    if the backend doesn't store the value exactly."""
+    float32_slider.min = 0
+    float32_slider.max = 1
+    on_change.assert_not_called()
+
+
+def test_set_same_value_with_lossy_backend(float32_slider, on_change):
+    """Re-assigning the current value doesn't call on_change, even if the backend
+    doesn't store the value exactly."""
+    float32_slider.value = 0.3
+    float32_slider.value = 0.3
+    on_change.assert_not_called()
+
+
+def test_backend_error_restores_on_change(slider, on_change, monkeypatch):
+    """If the backend raises an error during a programmatic change, on_change isn't
+    left suppressed."""
+    monkeypatch.setattr(slider._impl, "set_value", Mock(side_effect=RuntimeError))
+    with raises(RuntimeError):
+        slider.value = 30
+    on_change.assert_not_called()
+
+    slider._impl.interface.on_change()
+    on_change.assert_called_once_with(slider)
+
+
+def test_clear_handlers(slider, on_change):
+    """Clearing a handler installs a no-op handler."""
+    slider.on_change = None
+    slider.on_press = None
+    slider.on_release = None
+    for handler in [slider.on_change, slider.on_press, slider.on_release]:
+        assert handler._raw is None
+        assert handler() is None
+
+    slider.value = 10
+    on_change.assert_not_called()
+
+
 def assert_value(slider, on_change, value, *, tick_value=None, change_count=0):
     """Asserts that the slider's `value` and `tick_value` attributes have the given
     values, and that `on_change` has been called `change_count` times."""
@@ -554,6 +714,31 @@ def test_int_impl_discrete():
     assert impl.int_max == 8
 
 
+def test_int_impl_clamped_by_int_max():
+    """If changing the int max clamps the native value, the resulting change event uses
+    the new scale."""
+
+    class ClampingIntImpl(DummyIntImpl):
+        def set_int_max(self, max):
+            super().set_int_max(max)
+            if self.int_value > max:
+                self.int_value = max
+                self.on_change()
+
+    impl = ClampingIntImpl()
+    impl.int_value = 0
+    impl.set_min(0)
+    impl.set_max(1)
+    impl.set_tick_count(None)
+    impl.set_value(1)
+    assert impl.int_value == 10000
+
+    impl.set_tick_count(9)
+    assert impl.int_value == 8
+    assert impl.get_value() == approx(1)
+    impl.interface.on_change.assert_called_once_with()
+
+
 @pytest.mark.parametrize(
     "tick_count, data",
     [